@@ -1,9 +1,11 @@
+import asyncio
 import json
 import logging
 import os
 import pickle
 import tempfile
 
+import orjson
 from openai import AsyncOpenAI
 
 from app.common.utils import load_config
@@ -47,22 +49,19 @@ class TextEmbedder:
             jobs_with_text: List of (url_hash, text) tuples
             output_path: Path to write the JSONL file
         """
-        tasks = []
-
-        for url_hash, text in jobs_with_text:
-            task = {
-                "custom_id": url_hash,  # Use url_hash directly as custom_id
-                "method": "POST",
-                "url": "/v1/embeddings",
-                "body": {"model": self.model_name, "input": text},
-            }
-            tasks.append(task)
-
-        with open(output_path, "w", encoding="utf-8") as file:
-            for task in tasks:
-                file.write(json.dumps(task) + "\n")
-
-        logger.debug(f"Created batch JSONL file with {len(tasks)} tasks at {output_path}")
+        # orjson to bytes, one line per task - no pretty-printing, nobody reads
+        # these files
+        with open(output_path, "wb") as file:
+            for url_hash, text in jobs_with_text:
+                task = {
+                    "custom_id": url_hash,  # Use url_hash directly as custom_id
+                    "method": "POST",
+                    "url": "/v1/embeddings",
+                    "body": {"model": self.model_name, "input": text},
+                }
+                file.write(orjson.dumps(task) + b"\n")
+
+        logger.debug(f"Created batch JSONL file with {len(jobs_with_text)} tasks at {output_path}")
         return output_path
 
     async def create_embedding_batch(self, jobs_with_text: list[tuple[str, str]]) -> str:
@@ -84,7 +83,8 @@ class TextEmbedder:
             jsonl_path = tmp.name
 
         try:
-            self._create_batch_jsonl(jobs_with_text, jsonl_path)
+            # Write on a thread so a large batch file doesn't stall the event loop
+            await asyncio.to_thread(self._create_batch_jsonl, jobs_with_text, jsonl_path)
             # Upload the file to OpenAI
             with open(jsonl_path, "rb") as file:
                 batch_file = await self.client.files.create(file=file, purpose="batch")
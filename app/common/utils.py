@@ -4,12 +4,12 @@ Utility Functions
 app.common helper functions used across app.services
 """
 
-import json
 import logging
 import os
 import time
 from pathlib import Path
 
+import orjson
 import yaml
 
 logger = logging.getLogger(__name__)
@@ -97,12 +97,14 @@ def rate_limit_delay():
 
 def save_json(data: list[dict], filepath: str):
     """
-    Save data to JSON file with proper formatting
+    Save data to JSON file with proper formatting.
+    orjson serializes to UTF-8 bytes in one shot - much faster than stdlib
+    json and a single write call instead of chunked text encoding.
     """
     Path(filepath).parent.mkdir(parents=True, exist_ok=True)
 
-    with open(filepath, "w", encoding="utf-8") as f:
-        json.dump(data, f, indent=2, ensure_ascii=False)
+    with open(filepath, "wb") as f:
+        f.write(orjson.dumps(data, option=orjson.OPT_INDENT_2, default=str))
 
 
 def load_json(filepath: str) -> list[dict]:
@@ -112,5 +114,58 @@ def load_json(filepath: str) -> list[dict]:
     if not Path(filepath).exists():
         return []
 
-    with open(filepath, encoding="utf-8") as f:
-        return json.load(f)
+    with open(filepath, "rb") as f:
+        return orjson.loads(f.read())
+
+
+def append_ndjson(records: list[dict], filepath: str):
+    """
+    Append records to an NDJSON file (one JSON object per line).
+    Unlike save_json, this is O(new records) per call instead of rewriting
+    the whole file, so it's suited for the hot per-cycle write path.
+    """
+    Path(filepath).parent.mkdir(parents=True, exist_ok=True)
+
+    with open(filepath, "ab") as f:
+        for record in records:
+            f.write(orjson.dumps(record, default=str) + b"\n")
+
+
+def iter_ndjson(filepath: str):
+    """
+    Stream records from an NDJSON file one at a time.
+    Peak memory stays O(one record) regardless of file size, so prefer this
+    over load_ndjson when the corpus may be large.
+    """
+    if not Path(filepath).exists():
+        return
+
+    with open(filepath, "rb") as f:
+        for line in f:
+            line = line.strip()
+            if line:
+                yield orjson.loads(line)
+
+
+def load_ndjson(filepath: str) -> list[dict]:
+    """
+    Load all records from an NDJSON file
+    """
+    return list(iter_ndjson(filepath))
+
+
+def compact_ndjson(ndjson_path: str, json_path: str, key: str = "url") -> list[dict]:
+    """
+    Rebuild a deduplicated JSON view from an append-only NDJSON file.
+    Single pass keyed on `key` - the latest record for each key wins.
+    Returns the deduplicated records (also written to json_path).
+    """
+    deduplicated: dict[str, dict] = {}
+    for record in iter_ndjson(ndjson_path):
+        record_key = record.get(key)
+        if record_key:
+            deduplicated[record_key] = record
+
+    records = list(deduplicated.values())
+    save_json(records, json_path)
+    return records
@@ -33,10 +33,25 @@ def ensure_data_directory():
 
 
 def generate_url_hash(url: str) -> str:
-    """Generate a hash from a URL for unique identification."""
+    """Generate a hash from a URL for unique identification.
+
+    Uses blake2b rather than md5 - we only need dedup keys, not cryptographic
+    strength, and blake2b is noticeably faster on short inputs. digest_size=16
+    keeps the same 32-char hex width as the legacy md5 hashes.
+    """
     if not url:
         return ""
-    return hashlib.md5(url.encode("utf-8")).hexdigest()
+    return hashlib.blake2b(url.encode("utf-8"), digest_size=16).hexdigest()
+
+
+def generate_url_hashes(urls: list[str]) -> list[str]:
+    """Hash a batch of URLs in one tight loop.
+
+    Binds the hash constructor once so the per-URL cost is just the C-level
+    hashing, not repeated module/attribute lookups.
+    """
+    blake2b = hashlib.blake2b
+    return [blake2b(url.encode("utf-8"), digest_size=16).hexdigest() if url else "" for url in urls]
 
 
 @contextmanager
@@ -53,6 +68,8 @@ def get_db_connection(db_path: str):
     """
     conn = sqlite3.connect(db_path)
     conn.row_factory = sqlite3.Row  # Enable column access by name
+    # WAL keeps readers unblocked during writes and batches fsyncs
+    conn.execute("PRAGMA journal_mode=WAL")
     try:
         yield conn
         conn.commit()
@@ -206,6 +223,14 @@ class CompaniesDB:
                     source TEXT DEFAULT 'google_serper'
                 )
             """)
+            # Partial index so the stale-company scan is an indexed range scan
+            # over active rows instead of a full-table filter in Python.
+            cursor.execute(
+                """
+                CREATE INDEX IF NOT EXISTS idx_companies_active_stale
+                ON companies(last_scraped) WHERE is_active = 1
+                """
+            )
             conn.commit()
 
     def insert_company(self, company_data: dict) -> int | None:
@@ -243,6 +268,28 @@ class CompaniesDB:
             conn.commit()
             return cursor.rowcount > 0
 
+    def update_last_scraped_bulk(self, company_page_urls: list[str]) -> int:
+        """Update last_scraped for a batch of companies in one transaction.
+
+        One executemany + one commit instead of a connection, transaction and
+        fsync per URL. Returns the number of rows updated.
+        """
+        if not company_page_urls:
+            return 0
+
+        with get_db_connection(self.db_path) as conn:
+            cursor = conn.cursor()
+            cursor.executemany(
+                """
+                UPDATE companies
+                SET last_scraped = CURRENT_TIMESTAMP
+                WHERE company_page_url = ?
+                """,
+                [(url,) for url in company_page_urls],
+            )
+            conn.commit()
+            return cursor.rowcount
+
     def mark_company_inactive(self, company_page_url: str) -> bool:
         """Mark a company as inactive (page no longer available)."""
         with get_db_connection(self.db_path) as conn:
@@ -307,7 +354,7 @@ class CompaniesDB:
                 SELECT * FROM companies
                 WHERE is_active = 1
                 AND (last_scraped IS NULL OR last_scraped < datetime('now', '-' || ? || ' hours'))
-                ORDER BY last_scraped ASC NULLS FIRST
+                ORDER BY last_scraped IS NULL DESC, last_scraped ASC
                 """,
                 (max_age_hours,),
             )
@@ -517,6 +564,62 @@ class JobsDB:
         logger.warning(f"Location not found in reference data: '{clean_loc}' (from '{raw_loc}')")
         return None
 
+    _INSERT_JOB_COLUMNS = """(
+                    title, company_name, department, department_id,
+                    location, location_id, workplace_type, experience_level,
+                    employment_type, publish_date, description, uid,
+                    url, url_hash, from_domain, email, is_ai_inferred,
+                    original_website_job_url, embedding
+                )
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)"""
+
+    async def _build_job_row(self, job_data: dict) -> tuple[str, tuple] | None:
+        """Normalize a job dict into (url_hash, row tuple) for insertion."""
+        url = job_data.get("url")
+        if not url:
+            logger.error("Cannot insert job without URL")
+            return None
+
+        # Normalize department and location
+        dept_id = await self.get_department_id(job_data.get("department"))
+        loc_id = await self.get_location_id(job_data.get("location"))
+
+        # Handle description - convert dict to text if needed
+        description = job_data.get("description", "")
+        if isinstance(description, dict):
+            description = "\n\n".join(f"{k}:\n{v}" for k, v in description.items() if v)
+
+        # Generate URL hash
+        url_hash = generate_url_hash(url)
+
+        # Parse from_domain from URL
+        from urllib.parse import urlparse
+
+        from_domain = urlparse(url).netloc
+
+        row = (
+            job_data.get("title"),
+            job_data.get("company_name"),
+            job_data.get("department"),
+            dept_id,
+            job_data.get("location"),
+            loc_id,
+            job_data.get("workplace_type"),
+            job_data.get("experience_level"),
+            job_data.get("employment_type", "Full-time"),
+            job_data.get("last_updated") or job_data.get("publish_date"),
+            description,
+            job_data.get("uid"),
+            url,
+            url_hash,
+            from_domain,
+            job_data.get("email"),
+            job_data.get("is_ai_inferred", False),
+            job_data.get("original_website_job_url"),
+            job_data.get("embedding"),  # bytes (pickled) or None
+        )
+        return url_hash, row
+
     async def insert_job(self, job_data: dict) -> str | None:
         """
         Insert a new job into the database.
@@ -528,67 +631,12 @@ class JobsDB:
             or None if insertion failed (duplicate or error).
         """
         try:
-            # Validate required fields
-            url = job_data.get("url")
-            if not url:
-                logger.error("Cannot insert job without URL")
+            built = await self._build_job_row(job_data)
+            if built is None:
                 return None
+            url_hash, row = built
 
-            # Normalize department and location
-            dept_id = await self.get_department_id(job_data.get("department"))
-            loc_id = await self.get_location_id(job_data.get("location"))
-
-            # Handle description - convert dict to text if needed
-            description = job_data.get("description", "")
-            if isinstance(description, dict):
-                description = "\n\n".join(f"{k}:\n{v}" for k, v in description.items() if v)
-
-            # Generate URL hash
-            url_hash = generate_url_hash(url)
-
-            # Parse from_domain from URL
-            from_domain = None
-            if url:
-                from urllib.parse import urlparse
-
-                from_domain = urlparse(url).netloc
-
-            # Handle embedding - should be bytes (pickled) or None
-            embedding = job_data.get("embedding")
-
-            async with self._conn.execute(
-                """
-                INSERT INTO jobs (
-                    title, company_name, department, department_id,
-                    location, location_id, workplace_type, experience_level,
-                    employment_type, publish_date, description, uid,
-                    url, url_hash, from_domain, email, is_ai_inferred,
-                    original_website_job_url, embedding
-                )
-                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-                """,
-                (
-                    job_data.get("title"),
-                    job_data.get("company_name"),
-                    job_data.get("department"),
-                    dept_id,
-                    job_data.get("location"),
-                    loc_id,
-                    job_data.get("workplace_type"),
-                    job_data.get("experience_level"),
-                    job_data.get("employment_type", "Full-time"),
-                    job_data.get("last_updated") or job_data.get("publish_date"),
-                    description,
-                    job_data.get("uid"),
-                    url,
-                    url_hash,
-                    from_domain,
-                    job_data.get("email"),
-                    job_data.get("is_ai_inferred", False),
-                    job_data.get("original_website_job_url"),
-                    embedding,
-                ),
-            ):
+            async with self._conn.execute(f"INSERT INTO jobs {self._INSERT_JOB_COLUMNS}", row):
                 await self._conn.commit()
                 return url_hash  # Return url_hash for use as custom_id in embedding batch
 
@@ -607,6 +655,37 @@ class JobsDB:
             logger.error(f"Error inserting job with URL '{job_data.get('url')}': {e}", exc_info=True)
             return None
 
+    async def insert_jobs_bulk(self, jobs: list[dict]) -> list[str | None]:
+        """
+        Insert a batch of jobs inside a single transaction.
+
+        One commit (one fsync) for the whole batch instead of one per job,
+        which dominates insert cost for hundreds of jobs. Uses INSERT OR
+        IGNORE so duplicates surface as None results instead of aborting
+        the transaction.
+
+        Returns:
+            list aligned with the input: url_hash for each inserted job,
+            None where the job was a duplicate or invalid.
+        """
+        results: list[str | None] = []
+        try:
+            for job_data in jobs:
+                built = await self._build_job_row(job_data)
+                if built is None:
+                    results.append(None)
+                    continue
+                url_hash, row = built
+                cursor = await self._conn.execute(f"INSERT OR IGNORE INTO jobs {self._INSERT_JOB_COLUMNS}", row)
+                results.append(url_hash if cursor.rowcount else None)
+            await self._conn.commit()
+        except Exception as e:
+            logger.error(f"Error during bulk job insert: {e}", exc_info=True)
+            await self._conn.rollback()
+            return [None] * len(jobs)
+
+        return results
+
     async def update_job_embedding(self, url_hash: str, embedding: bytes) -> bool:
         """
         Update the embedding for a specific job.
@@ -631,17 +710,24 @@ class JobsDB:
             return False
 
     async def filter_existing_jobs(self, jobs: list[dict]) -> list[dict]:
-        """Return only jobs that don't exist in DB yet."""
-        # Generate hashes for all jobs
-        url_hashes = [generate_url_hash(job["url"]) for job in jobs if job.get("url")]
+        """Return only jobs that don't exist in DB yet (also dedupes within the batch)."""
+        if not jobs:
+            return []
+
+        # Hash each URL exactly once, keeping the hashes aligned with the jobs
+        url_hashes = generate_url_hashes([job.get("url", "") for job in jobs])
 
         placeholders = ",".join("?" * len(url_hashes))
         query = f"SELECT url_hash FROM jobs WHERE url_hash IN ({placeholders})"
         cursor = await self._conn.execute(query, url_hashes)
-        existing = {row[0] for row in await cursor.fetchall()}
-
-        # Filter out existing
-        new_jobs = [j for j in jobs if generate_url_hash(j.get("url")) not in existing]
+        seen = {row[0] for row in await cursor.fetchall()}
+
+        # Single pass: skip jobs already in the DB or repeated within this batch
+        new_jobs = []
+        for job, url_hash in zip(jobs, url_hashes):
+            if url_hash not in seen:
+                seen.add(url_hash)
+                new_jobs.append(job)
         return new_jobs
 
     async def get_jobs_without_embeddings(self, limit: int | None = None) -> list[dict]:
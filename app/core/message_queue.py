@@ -20,6 +20,8 @@ JOBS_QUEUE = "jobs_to_persist"
 class QueueItem:
     """Wraps a message with its data and ack/nack callbacks."""
 
+    __slots__ = ("data", "message")
+
     data: dict
     message: aio_pika.IncomingMessage
 
@@ -39,7 +41,10 @@ class RabbitMQConnection:
             self.connection = await aio_pika.connect_robust(host=self.host, port=self.port)
 
         if not self.channel or self.channel.is_closed:
-            self.channel = await self.connection.channel()
+            # Explicit publisher confirms: publish() doesn't return until the
+            # broker has accepted the message, so a dropped connection can't
+            # silently lose a company or job batch.
+            self.channel = await self.connection.channel(publisher_confirms=True)
             # Default prefetch; can be overridden in consumers
             await self.channel.set_qos(prefetch_count=10)
 
@@ -118,7 +123,7 @@ class JobQueue(BaseQueue):
         await self.rabbitmq.channel.default_exchange.publish(message, routing_key=self.queue_name)
         logger.info(f"Queued {len(jobs)} jobs from {source_url}")
 
-    async def consume(self, callback: Callable[[dict], Coroutine[Any, Any, None]], prefetch: int = 5):
+    async def consume(self, callback: Callable[[dict], Coroutine[Any, Any, None]], prefetch: int = 50):
         """Consume job batches from queue (runs forever)."""
         await self._ensure_connected()
         await self.rabbitmq.channel.set_qos(prefetch_count=prefetch)
@@ -24,6 +24,10 @@ CREATE INDEX IF NOT EXISTS idx_company_page_url ON companies(company_page_url);
 CREATE INDEX IF NOT EXISTS idx_is_active ON companies(is_active);
 CREATE INDEX IF NOT EXISTS idx_last_scraped ON companies(last_scraped);
 CREATE INDEX IF NOT EXISTS idx_discovered_at ON companies(discovered_at);
+
+-- Partial index covering the stale-company scan: only active rows, ordered by
+-- last_scraped, so get_stale_companies is an indexed range scan.
+CREATE INDEX IF NOT EXISTS idx_companies_active_stale ON companies(last_scraped) WHERE is_active = 1;
 """
 
 # Schema for jobs.db (comprehensive with normalization and reference data)
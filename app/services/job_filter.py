@@ -1,7 +1,13 @@
 import logging
+import re
 
 logger = logging.getLogger(__name__)
 
+# Compiled once: counting via findall runs a single C-level scan per pattern
+# instead of a Python-level loop over every character.
+_HEBREW_RE = re.compile("[\u0590-\u05FF]")
+_ALPHA_RE = re.compile(r"[^\W\d_]")
+
 
 class JobFilter:
     """Handles filtering, validation, and embedding of job batches."""
@@ -27,8 +33,8 @@ class JobFilter:
             return False
 
         # Count Hebrew characters
-        hebrew_chars = sum(1 for c in combined_text if "\u0590" <= c <= "\u05ff")
-        total_alpha_chars = sum(1 for c in combined_text if c.isalpha())
+        hebrew_chars = len(_HEBREW_RE.findall(combined_text))
+        total_alpha_chars = len(_ALPHA_RE.findall(combined_text))
 
         # If more than 10% of alphabetic characters are Hebrew, consider it a Hebrew job
         if total_alpha_chars > 0:
@@ -58,25 +64,27 @@ class JobFilter:
         valid_jobs = []
         filter_counts = {"hebrew": 0, "general_department": 0, "job_not_in_israel": 0}
 
+        # Bind the per-job checks to locals once - cheapest filter runs first,
+        # so most rejected jobs never reach the Hebrew character scan.
+        is_in_israel = JobFilter.is_in_israel_filter
+        is_hebrew = JobFilter.is_hebrew_job
+
         for job in jobs:
             # Filter: Jobs not in Israel
-            if not JobFilter.is_in_israel_filter(job):
+            if not is_in_israel(job):
                 filter_counts["job_not_in_israel"] += 1
                 continue
 
-            # Filter: Hebrew jobs
-            if JobFilter.is_hebrew_job(job):
-                filter_counts["hebrew"] += 1
+            # Filter: General department jobs (plain string check, no scan)
+            department = job.get("department")
+            if isinstance(department, str) and department.strip().lower() == "general":
+                filter_counts["general_department"] += 1
                 continue
 
-            # Filter: General department jobs
-            try:
-                department = str(job.get("department")).strip().lower()
-                if department == "general":
-                    filter_counts["general_department"] += 1
-                    continue
-            except AttributeError:
-                pass
+            # Filter: Hebrew jobs (most expensive - walks all text fields)
+            if is_hebrew(job):
+                filter_counts["hebrew"] += 1
+                continue
 
             valid_jobs.append(job)
 
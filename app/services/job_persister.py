@@ -31,15 +31,16 @@ class JobPersister:
 
         jobs_for_embedding: list[tuple[str, str]] = []
 
+        # Drop jobs with no embeddable text up-front, then insert the rest in
+        # one transaction instead of a commit per job.
+        jobs_with_text = [(job, text) for job in jobs if (text := self._extract_job_text(job)).strip()]
+
         async with self.jobs_db as jobs_db:
-            for job in jobs:
-                text = self._extract_job_text(job)
-                if not text.strip():
-                    continue
-
-                url_hash = await jobs_db.insert_job(job)
-                if url_hash:
-                    jobs_for_embedding.append((url_hash, text))
+            url_hashes = await jobs_db.insert_jobs_bulk([job for job, _ in jobs_with_text])
+
+        for (_job, text), url_hash in zip(jobs_with_text, url_hashes):
+            if url_hash:
+                jobs_for_embedding.append((url_hash, text))
 
         return jobs_for_embedding
 
@@ -3,17 +3,42 @@ from __future__ import annotations
 import asyncio
 import logging
 import random
+from urllib.parse import urlparse
 
 import httpx
 
 from app.core.db_utils import JobsDB
 from app.models.job import validate_jobs
-from app.services.message_queue import CompanyQueue, JobQueue, QueueItem, RabbitMQConnection
+from app.core.message_queue import CompanyQueue, JobQueue, QueueItem, RabbitMQConnection
 from app.services.scraper import JobScraper, fetch_html_from_url
 
 logger = logging.getLogger("app.core")
 
 
+class HostRateLimiter:
+    """Enforces a minimum gap between requests to the same host.
+
+    Companies on different hosts proceed in parallel; only requests that
+    actually share a host queue up behind each other. Replaces the old
+    flat sleep-after-every-request throttle.
+    """
+
+    def __init__(self, min_gap: float = 2.0):
+        self.min_gap = min_gap
+        self._next_allowed: dict[str, float] = {}
+        self._lock = asyncio.Lock()
+
+    async def wait(self, url: str):
+        host = urlparse(url).netloc
+        async with self._lock:
+            now = asyncio.get_running_loop().time()
+            start = max(now, self._next_allowed.get(host, now))
+            self._next_allowed[host] = start + self.min_gap
+        delay = start - now
+        if delay > 0:
+            await asyncio.sleep(delay)
+
+
 class ScraperCoordinator:
     """
     Coordinates concurrent scraping of companies from the RabbitMQ queue.
@@ -35,6 +60,7 @@ class ScraperCoordinator:
         self.jobs_db = jobs_db
         self.num_workers = num_workers
         self.prefetch = prefetch
+        self.rate_limiter = HostRateLimiter()
 
         # Internal queue for concurrent processing
         self.todo: asyncio.Queue[QueueItem] = asyncio.Queue()
@@ -48,8 +74,13 @@ class ScraperCoordinator:
         job_queue = JobQueue(self.rabbitmq)
         company_queue = CompanyQueue(self.rabbitmq)
 
-        # Open database connection for the lifetime of the coordinator
-        async with httpx.AsyncClient() as client:
+        # One shared client for the coordinator's lifetime: pooled, kept-alive
+        # connections sized to the worker count so no fetch waits on the pool
+        # and repeat requests to the same host skip the TCP/TLS handshake.
+        # HTTP/2 lets concurrent fetches to the same ATS host multiplex over
+        # one connection instead of opening a socket each.
+        limits = httpx.Limits(max_connections=self.num_workers * 2, max_keepalive_connections=self.num_workers)
+        async with httpx.AsyncClient(http2=True, limits=limits) as client:
             workers = [asyncio.create_task(self.worker(job_queue, client)) for _ in range(self.num_workers)]
             logger.info(f"Started {len(workers)} worker tasks")
 
@@ -94,6 +125,27 @@ class ScraperCoordinator:
             await item.message.ack()
             self.todo.task_done()
 
+    @staticmethod
+    def _parse_jobs(html: str) -> list[dict]:
+        """Parse jobs from raw HTML. Runs in a worker thread via asyncio.to_thread."""
+        return JobScraper(html).extract_jobs()
+
+    @staticmethod
+    def _retry_delay(error: Exception, attempt: int) -> float:
+        """Pick how long to sleep before the next fetch attempt.
+
+        Honors Retry-After on 429/503 responses (capped so one bad header
+        can't stall a worker); otherwise exponential backoff with jitter.
+        """
+        if isinstance(error, httpx.HTTPStatusError) and error.response.status_code in (429, 503):
+            retry_after = error.response.headers.get("Retry-After")
+            if retry_after:
+                try:
+                    return min(float(retry_after), 30.0)
+                except ValueError:
+                    pass  # HTTP-date format - fall through to backoff
+        return min(2 ** (attempt - 1), 10) + random.random()
+
     async def scrape_company(
         self, company: dict, job_queue: JobQueue, client: httpx.AsyncClient, max_retries: int = 3
     ) -> bool:
@@ -109,22 +161,24 @@ class ScraperCoordinator:
         html = None
         for attempt in range(1, max_retries + 1):
             try:
+                await self.rate_limiter.wait(url)
                 html = await fetch_html_from_url(url, client=client)
                 break  # Success, exit retry loop
             except Exception as e:
                 if attempt < max_retries:
-                    logger.warning(f"Attempt {attempt}/{max_retries} failed for {company_name}: {e}. Retrying ...")
-                    await asyncio.sleep(random.randint(1, 2))
+                    delay = self._retry_delay(e, attempt)
+                    logger.warning(
+                        f"Attempt {attempt}/{max_retries} failed for {company_name}: {e}. Retrying in {delay:.1f}s ..."
+                    )
+                    await asyncio.sleep(delay)
                 else:
                     logger.error(f"GIVING UP on {company_name} after {max_retries} failed attempts: {e}")
                     return False
 
-        # Rate limit between successful requests too
-        await asyncio.sleep(random.randint(1, 3))
-
         if html:
-            scraper = JobScraper(html)
-            raw_jobs = scraper.extract_jobs()
+            # HTML parsing is CPU-bound and would block the event loop (and all
+            # other workers) while it runs - push it onto a thread instead.
+            raw_jobs = await asyncio.to_thread(self._parse_jobs, html)
 
             # Step 1: Validate jobs with Pydantic
             valid_jobs, invalid_jobs = validate_jobs(raw_jobs)
@@ -1,27 +1,111 @@
 from __future__ import annotations
 
-import json
+import html
+import itertools
 import logging
 import random
 import re
+import sys
+from functools import cached_property
 
 import httpx
+import orjson
+import soupsieve as sv
 from bs4 import BeautifulSoup
 
 logger = logging.getLogger("app.core")
 
+# Prefer lxml's C tree builder - it parses multi-MB Comeet pages several times
+# faster than the pure-Python html.parser. Fall back for environments without it.
+try:
+    import lxml  # noqa: F401
+
+    BS_PARSER = "lxml"
+except ImportError:
+    BS_PARSER = "html.parser"
+
+
+def _intern(value):
+    """Intern categorical string fields (department, location, ...).
+
+    These repeat across most jobs at a company, so interning collapses the
+    duplicates to one object and gives dedup sets the identity fast-path.
+    """
+    return sys.intern(value) if isinstance(value, str) else value
+
+
+# Keyword alternations compiled once at import. A compiled regex matches all
+# keywords in a single scan of the string instead of one substring search per
+# keyword, which matters when classifying many <li> texts per page.
+_EMPLOYMENT_TYPE_RE = re.compile(r"full-time|part-time|contract|temporary|freelance")
+_EXPERIENCE_LEVEL_RE = re.compile(r"senior|junior|mid-level|entry|lead|principal|intern")
+
+# Comeet embeds its job data as a JS variable: COMPANY_POSITIONS_DATA = [...];
+_JS_VAR_TOKEN = "COMPANY_POSITIONS_DATA"
+
+
+def _extract_positions_payload(html_content: str) -> str | None:
+    """Slice the COMPANY_POSITIONS_DATA JSON array out of a Comeet page.
+
+    Pure literal scanning (C-level memmem via str.find): locate the token's
+    assignment - the first occurrence may just be a reference - then take
+    everything up to the closing "];". Replaces the old DOTALL regex, which
+    made the engine walk the multi-MB payload character by character.
+    """
+    n = len(html_content)
+    pos = 0
+    while True:
+        idx = html_content.find(_JS_VAR_TOKEN, pos)
+        if idx == -1:
+            return None
+        pos = idx + len(_JS_VAR_TOKEN)
+
+        # Expect optional whitespace, '=', optional whitespace, then '['
+        i = pos
+        while i < n and html_content[i].isspace():
+            i += 1
+        if i >= n or html_content[i] != "=":
+            continue
+        i += 1
+        while i < n and html_content[i].isspace():
+            i += 1
+        if i >= n or html_content[i] != "[":
+            continue
+
+        end = html_content.find("];", i)
+        if end == -1:
+            return None
+        return html_content[i : end + 1]
+
+# CSS selectors compiled once at import. SoupSieve tokenizes the selector a
+# single time instead of re-matching class strings per node on every find_all.
+_SEL_POSITION_LINKS = sv.compile("a.positionItem")
+_SEL_POSITION_TITLE = sv.compile("span.positionLink")
+_SEL_DETAIL_ITEMS = sv.compile("ul.positionDetails li")
+_SEL_MAP_ICON = sv.compile("i.fa-map-marker")
+
+# Lightweight HTML-to-text for description fragments: strip tags, collapse the
+# resulting blank-line runs. Far cheaper than building a parse tree per value.
+_TAG_RE = re.compile(r"<[^>]+>")
+_NEWLINE_RUN_RE = re.compile(r"\n\s*\n+")
+
 USER_AGENTS = [
     "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36",
     "Mozilla/5.0 (Windows NT 10.0; Win64; x64; rv:121.0) Gecko/20100101 Firefox/121.0",
     "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36",
 ]
 
+# Shuffle once, then rotate: every agent gets even use (random.choice can
+# repeat the same one) and there's no RNG call per request.
+random.shuffle(USER_AGENTS)
+_UA_CYCLE = itertools.cycle(USER_AGENTS)
+
 
 async def fetch_html_from_url(url: str, client: httpx.AsyncClient) -> str | None:
-    """Fetch HTML content for a given URL using requests."""
+    """Fetch HTML content for a given URL with the shared httpx.AsyncClient."""
     """I think this is a key function cause we may encounter problems with fetching html on a proxy"""
 
-    user_agent = random.choice(USER_AGENTS)
+    user_agent = next(_UA_CYCLE)
     headers = {
         "User-Agent": user_agent,
         "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8",
@@ -51,7 +135,11 @@ class JobScraper:
 
     def __init__(self, html_content: str):
         self._html_content = html_content
-        self._soup = BeautifulSoup(html_content, "html.parser")
+
+    @cached_property
+    def _soup(self) -> BeautifulSoup:
+        """DOM tree, built lazily - the JS-variable fast path never needs it."""
+        return BeautifulSoup(self._html_content, BS_PARSER)
 
     def extract_jobs(self) -> list[dict]:
         """
@@ -84,27 +172,25 @@ class JobScraper:
         Pattern: COMPANY_POSITIONS_DATA = [...];
         """
         try:
-            # Find the COMPANY_POSITIONS_DATA variable
-            pattern = r"COMPANY_POSITIONS_DATA\s*=\s*(\[.*?\]);"
-            match = re.search(pattern, self._html_content, re.DOTALL)
+            json_str = _extract_positions_payload(self._html_content)
 
-            if match:
-                json_str = match.group(1)
-                jobs_data = json.loads(json_str)
+            if json_str:
+                # orjson parses the multi-MB embedded array several times faster than stdlib json
+                jobs_data = orjson.loads(json_str)
 
                 # Parse and structure the job information
                 jobs = []
                 for job in jobs_data:
                     job_info = {
                         "title": job.get("name"),
-                        "department": job.get("department"),
-                        "location": self._parse_location(job.get("location", {})),
-                        "employment_type": job.get("employment_type"),
-                        "experience_level": job.get("experience_level"),
-                        "workplace_type": job.get("workplace_type"),
+                        "department": _intern(job.get("department")),
+                        "location": _intern(self._parse_location(job.get("location", {}))),
+                        "employment_type": _intern(job.get("employment_type")),
+                        "experience_level": _intern(job.get("experience_level")),
+                        "workplace_type": _intern(job.get("workplace_type")),
                         "uid": job.get("uid"),
                         "url": job.get("url_comeet_hosted_page"),
-                        "company_name": job.get("company_name"),
+                        "company_name": _intern(job.get("company_name")),
                         "email": job.get("email"),
                         "last_updated": job.get("time_updated"),
                         "original_website_job_url": self._get_original_website_url(job),
@@ -113,7 +199,7 @@ class JobScraper:
                     jobs.append(job_info)
 
                 return jobs
-        except (json.JSONDecodeError, AttributeError) as e:
+        except (orjson.JSONDecodeError, AttributeError) as e:
             logger.warning(f"Error parsing JS variable: {e}")
 
         return []
@@ -126,50 +212,43 @@ class JobScraper:
         jobs = []
 
         # Pattern 1: Angular/Comeet positionItem links
-        job_links = self._soup.find_all("a", class_="positionItem")
+        job_links = _SEL_POSITION_LINKS.select(self._soup)
 
         for link in job_links:
             # Extract title
-            title_elem = link.find("span", class_="positionLink")
+            title_elem = _SEL_POSITION_TITLE.select_one(link)
             title = title_elem.get_text(strip=True) if title_elem else None
 
             # Extract URL
             url = link.get("href") or link.get("ng-href")
 
             # Extract details from the list
-            details_list = link.find("ul", class_="positionDetails")
             location = None
             experience_level = None
             employment_type = None
 
-            if details_list:
-                items = details_list.find_all("li")
-                for item in items:
-                    text = item.get_text(strip=True)
-
-                    # Check if it contains location icon
-                    if item.find("i", class_="fa-map-marker"):
-                        location = text
-                    # Check for app.common employment type keywords
-                    elif any(
-                        keyword in text.lower()
-                        for keyword in ["full-time", "part-time", "contract", "temporary", "freelance"]
-                    ):
-                        employment_type = text
-                    # Check for experience level keywords
-                    elif any(
-                        keyword in text.lower()
-                        for keyword in ["senior", "junior", "mid-level", "entry", "lead", "principal", "intern"]
-                    ):
-                        experience_level = text
-                    # If none of the above, try to infer
-                    else:
-                        # If it's a short text without special chars, might be experience or type
-                        if len(text.split()) <= 2:
-                            if not experience_level:
-                                experience_level = text
-                            elif not employment_type:
-                                employment_type = text
+            for item in _SEL_DETAIL_ITEMS.select(link):
+                text = item.get_text(strip=True)
+                # Lowercase once per <li> and reuse - str.lower allocates a new string each call
+                text_low = text.lower()
+
+                # Check if it contains location icon
+                if _SEL_MAP_ICON.select_one(item):
+                    location = text
+                # Check for app.common employment type keywords
+                elif _EMPLOYMENT_TYPE_RE.search(text_low):
+                    employment_type = text
+                # Check for experience level keywords
+                elif _EXPERIENCE_LEVEL_RE.search(text_low):
+                    experience_level = text
+                # If none of the above, try to infer
+                else:
+                    # If it's a short text without special chars, might be experience or type
+                    if len(text.split()) <= 2:
+                        if not experience_level:
+                            experience_level = text
+                        elif not employment_type:
+                            employment_type = text
 
             job_info = {
                 "title": title,
@@ -250,14 +329,19 @@ class JobScraper:
 
                 # Skip if value is None or not a string
                 if value and isinstance(value, str):
-                    # Remove HTML tags for cleaner text
-                    clean_value = BeautifulSoup(value, "html.parser").get_text(separator="\n").strip()
-                    result[name] = clean_value
+                    # Remove HTML tags for cleaner text. A regex strip plus
+                    # entity unescape avoids spinning up a full parser for
+                    # every detail value (often dozens per job).
+                    clean_value = html.unescape(_TAG_RE.sub("\n", value))
+                    result[name] = _NEWLINE_RUN_RE.sub("\n", clean_value).strip()
 
         return result
 
     def _safe_extract(self, element, selectors: list[str]) -> str | None:
         """Safely extract text from element using multiple selector attempts."""
+        if element is None:
+            return None
+
         for selector in selectors:
             try:
                 if selector.startswith("."):
@@ -267,7 +351,9 @@ class JobScraper:
 
                 if found:
                     return found.get_text(strip=True)
-            except Exception as e:
+            # Only the lookup/text access on odd nodes can fail here; a blanket
+            # Exception would also swallow genuine bugs in the selectors.
+            except (AttributeError, KeyError) as e:
                 logger.warning(f"Error extracting text from element: {e}")
                 continue
         return None
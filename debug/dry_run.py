@@ -35,13 +35,18 @@ TEST_URLS = [
 ]
 
 
-async def scrape_url(name: str, url: str, client: httpx.AsyncClient) -> dict:
+# Bound concurrent fetches so we stay polite while still overlapping network waits
+MAX_CONCURRENT_FETCHES = 5
+
+
+async def scrape_url(name: str, url: str, client: httpx.AsyncClient, sem: asyncio.Semaphore) -> dict:
     """Scrape a single URL and return results."""
     result = {"name": name, "url": url, "success": False, "jobs": 0, "error": None}
 
     try:
-        logger.info(f"Fetching: {name}")
-        html = await fetch_html_from_url(url, client=client)
+        async with sem:
+            logger.info(f"Fetching: {name}")
+            html = await fetch_html_from_url(url, client=client)
 
         if not html:
             result["error"] = "No HTML"
@@ -53,11 +58,12 @@ async def scrape_url(name: str, url: str, client: httpx.AsyncClient) -> dict:
         result["success"] = True
 
         if jobs:
-            logger.info(f"  ✓ {len(jobs)} jobs found")
-            for job in jobs[:3]:
-                logger.info(f"    - {job.get('title', 'N/A')}")
+            # Build the sample listing once and log it in a single call
+            lines = [f"  ✓ {len(jobs)} jobs found"]
+            lines.extend(f"    - {job.get('title', 'N/A')}" for job in jobs[:3])
             if len(jobs) > 3:
-                logger.info(f"    ... +{len(jobs) - 3} more")
+                lines.append(f"    ... +{len(jobs) - 3} more")
+            logger.info("\n".join(lines))
         else:
             logger.warning("  ✗ No jobs found")
 
@@ -75,12 +81,11 @@ async def main():
 
     logger.info(f"Dry run: testing {len(TEST_URLS)} URLs\n")
 
-    results = []
+    # Fetch all URLs concurrently, bounded by a semaphore - wall time collapses
+    # to roughly the slowest single fetch instead of the sum of all of them.
+    sem = asyncio.Semaphore(MAX_CONCURRENT_FETCHES)
     async with httpx.AsyncClient() as client:
-        for item in TEST_URLS:
-            result = await scrape_url(item["name"], item["url"], client)
-            results.append(result)
-            await asyncio.sleep(1)  # Be polite
+        results = await asyncio.gather(*[scrape_url(item["name"], item["url"], client, sem) for item in TEST_URLS])
 
     # Summary
     success = sum(1 for r in results if r["success"])
@@ -89,11 +94,9 @@ async def main():
     logger.info(f"\n{'=' * 40}")
     logger.info(f"Done: {success}/{len(TEST_URLS)} succeeded, {total_jobs} total jobs")
 
-    if any(r["error"] for r in results):
-        logger.info("\nErrors:")
-        for r in results:
-            if r["error"]:
-                logger.info(f"  {r['name']}: {r['error']}")
+    errors = [f"  {r['name']}: {r['error']}" for r in results if r["error"]]
+    if errors:
+        logger.info("\nErrors:\n" + "\n".join(errors))
 
 
 if __name__ == "__main__":
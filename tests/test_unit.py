@@ -6,6 +6,7 @@ These tests run without external services (no RabbitMQ, no HTTP).
 
 from __future__ import annotations
 
+from app.common.utils import append_ndjson, compact_ndjson, load_ndjson
 from app.core.db_utils import generate_url_hash
 from app.services.job_filter import JobFilter
 
@@ -29,6 +30,35 @@ class TestUrlHash:
         assert generate_url_hash("") == ""
 
 
+# ============================================================================
+# NDJSON Persistence Tests
+# ============================================================================
+
+
+class TestNdjsonPersistence:
+    """Tests for append-only NDJSON helpers."""
+
+    def test_append_and_compact_latest_wins(self, tmp_path):
+        ndjson_path = str(tmp_path / "jobs_raw.ndjson")
+        json_path = str(tmp_path / "jobs_raw.json")
+
+        append_ndjson([{"url": "https://example.com/a", "title": "Old"}], ndjson_path)
+        append_ndjson(
+            [
+                {"url": "https://example.com/a", "title": "New"},
+                {"url": "https://example.com/b", "title": "Other"},
+            ],
+            ndjson_path,
+        )
+
+        assert len(load_ndjson(ndjson_path)) == 3
+
+        compacted = compact_ndjson(ndjson_path, json_path)
+        assert len(compacted) == 2
+        by_url = {record["url"]: record for record in compacted}
+        assert by_url["https://example.com/a"]["title"] == "New"
+
+
 # ============================================================================
 # Job Filter Tests
 # ============================================================================
@@ -117,6 +147,21 @@ class TestCompaniesDB:
         assert temp_companies_db.get_company_by_url(company_data["company_page_url"]) is None
         assert temp_companies_db.delete_company_by_url(company_data["company_page_url"]) is False
 
+    def test_update_last_scraped_bulk(self, temp_companies_db):
+        urls = [f"https://example.com/jobs/{i}" for i in range(3)]
+        for i, url in enumerate(urls):
+            temp_companies_db.insert_company(
+                {"company_name": f"Co {i}", "domain": "comeet", "company_page_url": url}
+            )
+
+        # Unknown URL in the batch is simply a no-op row
+        updated = temp_companies_db.update_last_scraped_bulk(urls + ["https://example.com/missing"])
+        assert updated == len(urls)
+        for url in urls:
+            assert temp_companies_db.get_company_by_url(url)["last_scraped"] is not None
+
+        assert temp_companies_db.update_last_scraped_bulk([]) == 0
+
 
 # ============================================================================
 # Jobs Database Tests
@@ -159,3 +204,24 @@ class TestJobsDB:
         assert await temp_jobs_db.delete_job_by_url(job_data["url"]) is True
         assert await temp_jobs_db.get_job_by_url(job_data["url"]) is None
         assert await temp_jobs_db.delete_job_by_url(job_data["url"]) is False
+
+    async def test_insert_jobs_bulk(self, temp_jobs_db):
+        jobs = [
+            {"title": "Backend Engineer", "url": "https://example.com/jobs/backend"},
+            {"title": "Frontend Engineer", "url": "https://example.com/jobs/frontend"},
+            # Duplicate URL within the batch - should come back as None
+            {"title": "Backend Engineer (dup)", "url": "https://example.com/jobs/backend"},
+            # Missing URL - invalid
+            {"title": "No URL"},
+        ]
+
+        url_hashes = await temp_jobs_db.insert_jobs_bulk(jobs)
+
+        assert len(url_hashes) == len(jobs)
+        assert url_hashes[0] is not None
+        assert url_hashes[1] is not None
+        assert url_hashes[2] is None
+        assert url_hashes[3] is None
+
+        stored = await temp_jobs_db.get_job_by_url("https://example.com/jobs/backend")
+        assert stored["title"] == "Backend Engineer"